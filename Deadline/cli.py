@@ -1,6 +1,6 @@
 """CLI for manual debugging."""
 
-from .game_logic import Game as GameData, CardTarget
+from .game_logic import Game as GameData
 
 
 class MockNetwork:
@@ -132,21 +132,16 @@ def game():
                 if not can_use_card['res']:
                     print(can_use_card['msg'])
                     continue
-                match game_data[i].get_card_targets(cid):
-                    case CardTarget.ANY:
-                        target = input('Enter player or opponent: ')
-                        if target not in ['player', 'opponent']:
-                            print('Incorrect target!')
-                            continue
-                        target_pid = game_data[i].get_game_info()[target]['pid']
-                    case CardTarget.PLAYER:
-                        target_pid = game_data[i].get_game_info()['player']['pid']
-                    case CardTarget.OPPONENT:
-                        target_pid = game_data[i].get_game_info()['opponent']['pid']
-                    case CardTarget.GLOBAL:
-                        target_pid = None
-                    case _:
-                        raise ValueError
+                target_pids = game_data[i].get_card_target_pids(cid)
+                if len(target_pids) > 1:
+                    target = input('Enter player or opponent: ')
+                    if target not in ['player', 'opponent']:
+                        print('Incorrect target!')
+                        continue
+                    target_pid = game_data[i].get_game_info()[target]['pid']
+                else:
+                    # Global cards have no target
+                    target_pid = next(iter(target_pids), None)
                 game_data[i].player_uses_card(idx, target_pid, None)
                 game_data[1-i].opponent_uses_card(idx, target_pid, None)
             case 'S':
@@ -1,44 +1,151 @@
 import enum
 import abc
 import locale
-from typing import Dict, List, Optional
+import threading
+import functools
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
 import pygame as pg
 import pygame.typing as pgt
 
 from Deadline.network import Network
-from Deadline.localization import _
-import Deadline.game_logic as gl
+from Deadline.localization import _, set_locale
+
+if TYPE_CHECKING:
+    import Deadline.game_logic as gl
 
 # Typing
 Vector2 = tuple[int, int]
 Point = Vector2
 
 WINDOW_SIZE = (1920, 1080)
+TARGET_FPS = 60
+# Dirty regions covering more than this share of the screen are pushed as one full update
+FULL_UPDATE_AREA_RATIO = 0.5
 DEFAULT_FONT = pg.font.get_default_font()
+# Network notifications, posted from network worker threads
+NET_CONNECTED = pg.event.custom_type()
+NET_HOST_READY = pg.event.custom_type()
+# Event types for which only the latest event in a frame matters
+COALESCED_EVENT_TYPES = frozenset((pg.MOUSEMOTION, pg.WINDOWSIZECHANGED))
+
+
+def get_events_dict(events: Optional[List[pg.Event]] = None) -> Dict[int, List[pg.Event]]:
+    """
+    Organize Pygame events in a dictionary by event type.
 
+    Events of types from COALESCED_EVENT_TYPES are coalesced: only the latest one is kept.
 
-def get_events_dict() -> Dict[int, List[pg.Event]]:
-    """Get all Pygame events and organize them in a dictionary by event type."""
-    events = pg.event.get()
+    Args:
+        events: Events to organize. All pending events are taken from the queue if not given.
+
+    """
     events_dict: Dict[int, List[pg.Event]] = {}
 
-    for event in events:
-        events_dict[event.type] = events_dict.get(event.type, []) + [event]
+    for event in pg.event.get() if events is None else events:
+        if event.type in COALESCED_EVENT_TYPES:
+            events_dict[event.type] = [event]
+        else:
+            events_dict.setdefault(event.type, []).append(event)
     return events_dict
 
 
+@functools.lru_cache(maxsize=64)
+def get_font(font_name: Optional[str], font_size: int) -> pg.font.Font:
+    """
+    Get a font. Each font is loaded only once and shared between all texts using it.
+
+    Args:
+        font_name: Font file name. The pygame default font is used if None.
+        font_size: Font size.
+
+    """
+    return pg.font.Font(font_name, font_size)
+
+
+@functools.lru_cache(maxsize=256)
+def render_text(text: str, font_name: Optional[str], font_size: int, color: tuple[int, int, int, int]) -> pg.Surface:
+    """
+    Render a text line. Equal lines, e.g. a button label repeated in a title, are rendered only once.
+
+    The returned surface is shared, so it must not be drawn on.
+
+    Args:
+        text: Text to render.
+        font_name: Font file name.
+        font_size: Font size.
+        color: Text color as an RGBA tuple.
+
+    """
+    surface = get_font(font_name, font_size).render(text, True, color)
+    if pg.display.get_surface() is not None:
+        # Match the display pixel format once, so blits don't convert pixels every frame
+        surface = surface.convert_alpha()
+    return surface
+
+
+def get_layout(window_size: tuple[int, int]) -> Dict[str, int | tuple[int, int]]:
+    """
+    Compute named screen positions the scenes place their widgets at.
+
+    The screen is divided into a grid of 32 columns and 16 rows.
+
+    Args:
+        window_size: The size of the game window (width, height).
+
+    """
+    w, h = window_size
+    return {
+        'col': w // 32,  # Grid column width
+        'row': h // 16,  # Grid row height
+        'left_x': w // 3,
+        'centre_x': w // 2,
+        'right_x': w // 3 * 2,
+        'title': (w // 2, h // 8),
+        'status': (w // 2, h // 4 * 3),
+    }
+
+
+_TEXTURES: Dict[tuple[str, bool], pg.Surface] = {}
+
+
+def load_texture(path: str, alpha: bool = True) -> pg.Surface:
+    """
+    Load an image converted to the display format. Each image is read from disk only once.
+
+    The returned surface is shared, so it must not be drawn on.
+
+    Args:
+        path: Path to the image.
+        alpha: Whether the image has transparent pixels. Opaque images are converted without alpha.
+
+    """
+    key = (path, alpha)
+    texture = _TEXTURES.get(key)
+    if texture is None:
+        image = pg.image.load(path)
+        texture = _TEXTURES[key] = image.convert_alpha() if alpha else image.convert()
+    return texture
+
+
 class Game():
     """
     Main game class that manages the game loop.
 
     Attributes
         window_size (tuple): The size of the game window (width, height).
+        layout (dict): Named screen positions shared by the scenes, computed from `window_size`.
         canvas (pygame.Surface): The main drawing surface.
         display (pygame.Surface): The display surface.
         default_font (str): The default font name.
         current_scene (Scene): The currently active scene.
         running (bool): Flag indicating if the game is running.
         network (Network): class for network communication.
+        frame_events (list): Events of the current frame, in the order they arrived.
+        events (dict): Events of the current frame, grouped by type.
+        mouse_pos (tuple): Mouse position in the current frame.
+        mouse_pressed (bool): Whether the left mouse button is held in the current frame.
+        target_fps (int): Frame rate the game loop is capped at.
 
     """
 
@@ -52,19 +159,34 @@ class Game():
         """
         pg.init()
         self.window_size = WINDOW_SIZE
-        self.canvas = pg.Surface(self.window_size)
         self.display = pg.display.set_mode(self.window_size)
+        self.canvas = pg.Surface(self.window_size).convert()
+        self.layout = get_layout(self.window_size)
         self.default_font = DEFAULT_FONT
         self.current_scene = scene_class(self)
         self.running: bool = True
         self.network = Network()
+        self.network.on_connected = functools.partial(pg.event.post, pg.event.Event(NET_CONNECTED))
+        self.network.on_host_ready = functools.partial(pg.event.post, pg.event.Event(NET_HOST_READY))
         self.err = False
         self.err_popup = None
+        self.clock = pg.time.Clock()
+        self.target_fps = TARGET_FPS
+        self.poll_input()
+
+    def poll_input(self) -> None:
+        """Read the input of the current frame once, so scenes and widgets don't query pygame themselves."""
+        # One pump per frame; events and mouse state below all come from it
+        pg.event.pump()
+        self.frame_events = pg.event.get(pump=False)
+        self.events = get_events_dict(self.frame_events)
+        self.mouse_pos = pg.mouse.get_pos()
+        self.mouse_pressed = pg.mouse.get_pressed()[0]
 
     def run(self) -> None:
         """Run the main game loop until self.running becomes False."""
         while self.running:
-            self.events = get_events_dict()
+            self.poll_input()
             if pg.QUIT in self.events.keys():
                 self.running = False
             try:
@@ -75,6 +197,7 @@ class Game():
                     if self.err_popup.mousedown:
                         self.err = False
                         self.err_popup = None
+                        self.current_scene.invalidate()
             except Exception as e:
                 err_text = Text(
                     self,
@@ -89,13 +212,29 @@ class Game():
                                             None,
                                             err_text)
                 self.err = True
+            self.clock.tick(self.target_fps)
 
         pg.quit()
 
-    def blit_screen(self) -> None:
-        """Update the display by blitting the canvas to the display surface."""
-        self.display.blit(self.canvas, (0, 0))
-        pg.display.update()
+    def blit_screen(self, rects: Optional[List[pg.Rect]] = None) -> None:
+        """
+        Update the display by blitting the canvas to the display surface.
+
+        Args:
+            rects: Regions to update. The whole screen is updated if not given, or if the regions
+                cover more than FULL_UPDATE_AREA_RATIO of it.
+
+        """
+        if rects is not None and sum(rect.w * rect.h for rect in rects) > \
+                FULL_UPDATE_AREA_RATIO * self.window_size[0] * self.window_size[1]:
+            rects = None
+        if rects is None:
+            self.display.blit(self.canvas, (0, 0))
+            pg.display.update()
+        else:
+            for rect in rects:
+                self.display.blit(self.canvas, rect, rect)
+            pg.display.update(rects)
 
 
 class Anchor(enum.Enum):
@@ -151,8 +290,11 @@ class Text():
         font_size (int): Current font size.
         font_name (str): Current font name.
         color (pygame.Color): Current text color.
-        font (pygame.font.Font): The pygame Font object.
-        text_surface (pygame.Surface): The rendered text surface.
+        font (pygame.font.Font): The pygame Font object, shared between texts with the same font name and size.
+        text_surface (pygame.Surface): The rendered text surface, re-rendered only by `change` and `set_text`.
+        visible (bool): Whether the text is drawn by a scene.
+        dirty (bool): Whether the text has changed since it was last drawn by a scene.
+        last_rect (pygame.Rect): The bounding rectangle the text had when it was last drawn by a scene.
 
     """
 
@@ -167,7 +309,9 @@ class Text():
             color: pgt.ColorLike = pg.Color(0, 0, 0)):
         """Initialize a Text object."""
         self.game = game
+        self.visible = True
         self.change(pos, anchor, text, font_size, font_name, color)
+        self.last_rect = self.rect.copy()
 
     def change(
             self,
@@ -184,7 +328,7 @@ class Text():
                 self.font_size = font_size
             if font_name:
                 self.font_name = font_name
-            self.font = pg.font.Font(self.font_name, self.font_size)
+            self.font = get_font(self.font_name, self.font_size)
 
         change = change or bool(text) or bool(color)
         if change:
@@ -192,7 +336,7 @@ class Text():
                 self.text = text
             if color:
                 self.color = color
-            self.text_surface = self.font.render(self.text, True, self.color)
+            self._render()
 
         change = change or bool(pos) or bool(anchor)
         if change:
@@ -202,14 +346,39 @@ class Text():
                 self.anchor = anchor
             self.rect = self.text_surface.get_rect()
             anchor_rect(self.rect, self.pos, self.anchor)
+            self.dirty = True
+
+    def set_text(self, text: str) -> None:
+        """Re-render the text with a new string in place, keeping its position, anchor, font and color."""
+        if text == self.text:
+            return
+        self.text = text
+        self._render()
+        self.rect = self.text_surface.get_rect()
+        anchor_rect(self.rect, self.pos, self.anchor)
+        self.dirty = True
+
+    def _render(self) -> None:
+        """Render the text surface from the current text, font and color."""
+        self.text_surface = render_text(self.text, self.font_name, self.font_size, tuple(pg.Color(self.color)))
 
     def update(self):
         """Do nothing.Dummy."""
         pass
 
-    def draw(self):
-        """Draw the text surface to the game's canvas."""
-        self.game.canvas.blit(self.text_surface, self.rect)
+    def is_idle(self) -> bool:
+        """Check whether the text looks the same as when it was created. Text has no other states."""
+        return True
+
+    def draw(self, surface: Optional[pg.Surface] = None):
+        """
+        Draw the text surface.
+
+        Args:
+            surface: Surface to draw on. Defaults to the game's canvas.
+
+        """
+        (self.game.canvas if surface is None else surface).blit(self.text_surface, self.rect)
 
 
 class Button(abc.ABC):
@@ -226,6 +395,7 @@ class Button(abc.ABC):
             text_anchor: Anchor = Anchor.CENTRE):
         """Initialize a Button instance."""
         self.game = game
+        self.visible = True
 
         self.mouseover = False
         self.mousedown = False
@@ -244,6 +414,7 @@ class Button(abc.ABC):
             self.text = None
 
         self.change(size, pos, anchor, images, text, text_anchor)
+        self.last_rect = self.rect.copy()
 
     def change(
             self,
@@ -287,8 +458,22 @@ class Button(abc.ABC):
         if change and self.text:
             self.text.change(pos=rect_anchor_pos(self.rect, self.text_anchor))
 
-    def draw(self):
-        """Draw the button to the game's canvas."""
+        self.dirty = True
+
+    def is_idle(self) -> bool:
+        """Check whether the button is neither hovered nor held, i.e. drawn with its idle look."""
+        return not (self.mouseover or self.mousehold)
+
+    def draw(self, surface: Optional[pg.Surface] = None):
+        """
+        Draw the button.
+
+        Args:
+            surface: Surface to draw on. Defaults to the game's canvas.
+
+        """
+        if surface is None:
+            surface = self.game.canvas
         if self.images:
             if self.mousehold:
                 self.image = self.image_clicked
@@ -297,7 +482,7 @@ class Button(abc.ABC):
             else:
                 self.image = self.image_idle
 
-            self.game.canvas.blit(self.image, self.rect)
+            surface.blit(self.image, self.rect)
         else:
             if self.mousehold:
                 self.color = self.color_clicked
@@ -306,13 +491,14 @@ class Button(abc.ABC):
             else:
                 self.color = self.color_idle
 
-            pg.draw.rect(self.game.canvas, self.color, self.rect)
+            pg.draw.rect(surface, self.color, self.rect)
 
         if self.text:
-            self.text.draw()
+            self.text.draw(surface)
 
     def check_event(self):
         """Check for mouse events related to the button (hover, click)."""
+        state = (self.mouseover, self.mousehold)
         self.mousedown = False
         self.mouseup = False
         if pg.MOUSEMOTION in self.game.events.keys():
@@ -332,6 +518,9 @@ class Button(abc.ABC):
                     self.hold = False
                     break
 
+        if state != (self.mouseover, self.mousehold):
+            self.dirty = True
+
     @abc.abstractmethod
     def update(self):
         """Abstract method to be implemented by subclasses for button behavior."""
@@ -377,10 +566,10 @@ class BackButton(SceneSwitchButton):
         self.arrow_color = "black"
         self.arrow_polygon = ((100, 55), (100, 65), (40, 65), (40, 75), (15, 60), (40, 45), (40, 55))
 
-    def draw(self):
-        """Draw the button to the game's canvas."""
-        super().draw()
-        pg.draw.polygon(self.game.canvas, self.arrow_color, self.arrow_polygon)
+    def draw(self, surface: Optional[pg.Surface] = None):
+        """Draw the button with the arrow on it."""
+        super().draw(surface)
+        pg.draw.polygon(self.game.canvas if surface is None else surface, self.arrow_color, self.arrow_polygon)
 
 
 class ChooseLanguageButton(Button):
@@ -391,13 +580,15 @@ class ChooseLanguageButton(Button):
             game: Game,
             size: Vector2,
             pos: Point,
-            anchor: Anchor = Anchor.CENTRE):
-        """Initialize a ChooseLanguageButton."""
+            anchor: Anchor = Anchor.CENTRE,
+            on_language_changed: Optional[Callable[[], None]] = None):
+        """Initialize a ChooseLanguageButton. `on_language_changed` is called after the user switches the language."""
         super().__init__(game=game,
                          size=size,
                          pos=pos,
                          anchor=anchor)
 
+        self.on_language_changed = on_language_changed
         self.pos = pos
         self.show_options = False
         self.options = [(("en_US", "UTF-8"), "English"),
@@ -418,15 +609,13 @@ class ChooseLanguageButton(Button):
         """Switch locale if clicked."""
         if self.mousedown:
             self.cur_option = (self.cur_option + 1) % len(self.options)
-            locale.setlocale(locale.LC_ALL, self.options[self.cur_option][0])
-            self.text = Text(
-                self.game,
-                self.pos,
-                Anchor.CENTRE,
-                self.options[self.cur_option][1],
-                80)
+            set_locale(self.options[self.cur_option][0])
+            if self.on_language_changed is not None:
+                self.on_language_changed()
+            self.text.set_text(self.options[self.cur_option][1])
             self.mousedown = False
             self.mousehold = False
+            self.dirty = True
 
 
 class ExitButton(Button):
@@ -468,6 +657,7 @@ class TextField:
             placeholder: str = ""):
         """Initialize TextField class."""
         self.game = game
+        self.visible = True
         self.size = size
         self.pos = pos
         self.anchor = anchor
@@ -479,14 +669,17 @@ class TextField:
         self.max_length = max_length
         self.placeholder = placeholder
 
-        self.font = pg.font.Font(None, font_size)
+        self.font = get_font(None, font_size)
         self.value = ""
         self.active = False
+        self._rendered_value = None  # Value the cached text surface was rendered for
         if len(placeholder) > max_length:
             print(_("Warning! Placeholder length is larger then max_length of the field!"))
 
         self.rect = pg.Rect(0, 0, *size)
         anchor_rect(self.rect, pos, anchor)
+        self.dirty = True
+        self.last_rect = self.rect.copy()
 
         self.cursor_visible = True
         self.cursor_counter = 0
@@ -494,8 +687,9 @@ class TextField:
 
     def check_event(self):
         """Check for mouse events related to the button (hover, click)."""
+        state = (self.active, self.value)
         self.mousedown = False
-        self.mouseover = self.rect.collidepoint(pg.mouse.get_pos())
+        self.mouseover = self.rect.collidepoint(self.game.mouse_pos)
 
         for event in self.game.events.get(pg.MOUSEBUTTONDOWN, []):
             if event.button == 1:
@@ -515,6 +709,9 @@ class TextField:
                 elif event.unicode and len(self.value) < self.max_length and event.key != pg.K_TAB:
                     self.value += event.unicode
 
+        if state != (self.active, self.value):
+            self.dirty = True
+
     def update(self):
         """Update the cursor for the text field."""
         if self.active:
@@ -522,19 +719,36 @@ class TextField:
             if self.cursor_counter >= self.cursor_switch_frames:
                 self.cursor_counter = 0
                 self.cursor_visible = not self.cursor_visible
-        else:
+                self.dirty = True
+        elif self.cursor_visible:
             self.cursor_visible = False
+            self.dirty = True
 
-    def draw(self):
-        """Draw the text field with current value and cursor."""
-        # Field and border
-        pg.draw.rect(self.game.canvas, self.bg_color, self.rect)
-        pg.draw.rect(self.game.canvas, self.border_color, self.rect, self.border_width)
+    def is_idle(self) -> bool:
+        """Check whether the field isn't being edited, i.e. drawn without the cursor."""
+        return not self.active
 
-        # Text inside
-        text = self.value if self.value else self.placeholder
-        color = self.font_color if self.value else (180, 180, 180)
-        text_surface = self.font.render(text, True, color)
+    def draw(self, surface: Optional[pg.Surface] = None):
+        """
+        Draw the text field with current value and cursor.
+
+        Args:
+            surface: Surface to draw on. Defaults to the game's canvas.
+
+        """
+        if surface is None:
+            surface = self.game.canvas
+        # Field and border
+        pg.draw.rect(surface, self.bg_color, self.rect)
+        pg.draw.rect(surface, self.border_color, self.rect, self.border_width)
+
+        # Text inside, rendered again only when the value changes (not when the cursor blinks)
+        if self._rendered_value != self.value:
+            self._rendered_value = self.value
+            text = self.value if self.value else self.placeholder
+            color = self.font_color if self.value else (180, 180, 180)
+            self._text_surface = self.font.render(text, True, color)
+        text_surface = self._text_surface
         text_rect = text_surface.get_rect()
         text_rect.centery = self.rect.centery
         text_rect.x = self.rect.x + 8  # Position text inside rect
@@ -544,18 +758,65 @@ class TextField:
         cursor_y1 = text_rect.top + 3
         cursor_y2 = text_rect.bottom - 3
 
-        self.game.canvas.blit(text_surface, text_rect)
+        surface.blit(text_surface, text_rect)
 
         if self.active and self.cursor_visible:
-            pg.draw.line(self.game.canvas, self.font_color, (cursor_x, cursor_y1), (cursor_x, cursor_y2), 2)
+            pg.draw.line(surface, self.font_color, (cursor_x, cursor_y1), (cursor_x, cursor_y2), 2)
 
 
 class ConnectButton(Button):
-    """A Button that connects to network (stub for extension)."""
+    """A Button that runs a network operation in the background when clicked."""
+
+    def __init__(
+            self,
+            game: Game,
+            size: Vector2,
+            pos: Point,
+            anchor: Anchor = Anchor.CENTRE,
+            images: Optional[List[pg.Surface]] = None,
+            text: Optional[Text] = None,
+            text_anchor: Anchor = Anchor.CENTRE):
+        """Initialize a ConnectButton."""
+        Button.__init__(self, game, size, pos, anchor, images, text, text_anchor)
+        self._future: Optional[Future] = None
+
+    @property
+    def busy(self) -> bool:
+        """Whether the background network operation is still running."""
+        return self._future is not None and not self._future.done()
+
+    def run_task(self, func, *args):
+        """
+        Run a blocking network operation in a background thread, so it doesn't stall the game loop.
+
+        The thread is a daemon one, unlike the workers of a ThreadPoolExecutor, so a connection
+        attempt that hangs doesn't keep the game from exiting.
+
+        Args:
+            func: Network operation.
+            *args: Arguments of the operation.
+
+        """
+        self._future = Future()
+        threading.Thread(target=self._task, args=(self._future, func, *args), daemon=True).start()
+
+    @staticmethod
+    def _task(future: Future, func, *args):
+        """Run the network operation and resolve its future with the result or the error it raised."""
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(func(*args))
+        except Exception as e:
+            future.set_exception(e)
 
     def update(self):
-        """Update button."""
-        return super().update()
+        """Re-raise the error of the finished background network operation in the main thread."""
+        if self._future is not None and self._future.done():
+            future, self._future = self._future, None
+            error = future.exception()
+            if error is not None:
+                raise error
 
 
 class CheckBoxButton(Button):
@@ -600,11 +861,11 @@ class CheckBoxButton(Button):
 
         )
 
-    def draw(self):
+    def draw(self, surface: Optional[pg.Surface] = None):
         """Draw the checkbox button (with tick if clicked)."""
-        super().draw()
+        super().draw(surface)
         if self.clicked:
-            pg.draw.polygon(self.game.canvas, self.tick_color, self.tick_polygon)
+            pg.draw.polygon(self.game.canvas if surface is None else surface, self.tick_color, self.tick_polygon)
 
     def update(self):
         """Toggle checkbox state if clicked."""
@@ -612,6 +873,7 @@ class CheckBoxButton(Button):
             self.clicked = not self.clicked
             self.mousedown = False
             self.mousehold = False
+            self.dirty = True
 
 
 class ErrorPopUp(Button):
@@ -661,8 +923,8 @@ class Card():
     def __init__(
             self,
             game: Game,
-            game_obj: gl.Game,
-            card_info: gl.Card,
+            game_obj: "gl.Game",
+            card_info: "gl.Card",
             card_type_images: Dict[str, pg.Surface],
             height: int,
             pos: Point,
@@ -672,7 +934,7 @@ class Card():
         self.game_obj = game_obj
         self.card_info = card_info
         self.card_type_images = card_type_images
-        self.card_image = pg.image.load(card_info.image)
+        self.card_image = load_texture(card_info.image, alpha=False)  # Card pictures are opaque
         self.size = (round(height * CARD_WIDTH_TO_HEIGHT_RATIO), height)
         self.pos = pos
         self.anchor = anchor
@@ -746,21 +1008,47 @@ class Card():
                 _("0 / " + str(self.game_obj.get_task_info(self.card_info.task).difficulty)),
                 self.size[0] // 8)
 
+            self.texts = (self.name_text, self.clock_text, self.award_text, self.penalty_text,
+                          self.progress_text, self.description_text)
+        else:
+            self.texts = (self.name_text, self.description_text)
+        self._update_blit_pairs()
+
     def update(self):
         """Do nothing. Dummy."""
         pass
 
-    def draw(self):
-        """Draw the card and its elements."""
-        self.game.canvas.blit(self.surface_card_image, self.rect_image)
-        self.game.canvas.blit(self.surface_card_type_image, self.rect)
-        self.name_text.draw()
-        if self.card_type == "TaskCard":
-            self.clock_text.draw()
-            self.award_text.draw()
-            self.penalty_text.draw()
-            self.progress_text.draw()
-        self.description_text.draw()
+    def get_blit_pairs(self, pos_override: Optional[Point] = None) -> List[tuple[pg.Surface, pg.Rect]]:
+        """
+        Get the (surface, destination) pairs of the card's elements in draw order, for `Surface.fblits()`.
+
+        The returned list may be the card's cache and must not be modified.
+
+        Args:
+            pos_override: Position to draw the card at instead of its own, e.g. to lift a hovered card.
+                The card itself isn't moved.
+
+        """
+        if pos_override is None or pos_override == self.pos:
+            # Fast path for cards drawn where they are, i.e. almost all of them: the pairs are cached
+            return self.blit_pairs
+        offset = (pos_override[0] - self.pos[0], pos_override[1] - self.pos[1])
+        return [(surface, rect.move(offset)) for surface, rect in self.blit_pairs]
+
+    def _update_blit_pairs(self):
+        """Cache the blit pairs of the card at its current position. Called whenever the card moves."""
+        self.blit_pairs = [(self.surface_card_image, self.rect_image), (self.surface_card_type_image, self.rect)]
+        self.blit_pairs += [(text.text_surface, text.rect) for text in self.texts]
+
+    def draw(self, pos_override: Optional[Point] = None):
+        """
+        Draw the card and its elements.
+
+        Args:
+            pos_override: Position to draw the card at instead of its own. The card itself isn't moved.
+
+        """
+        self.game.canvas.fblits(self.get_blit_pairs(pos_override))
 
     def move_to(self, pos: Point):
         """Move card to new position."""
@@ -790,3 +1078,4 @@ class Card():
             self.progress_text.change(
                 pos=(self.rect.topleft[0] + round(CARD_PROGGRESS_CENTRE_OFFSET_RATIO[0] * self.size[0]),
                      self.rect.topleft[1] + round(CARD_PROGGRESS_CENTRE_OFFSET_RATIO[1] * self.size[1])))
+        self._update_blit_pairs()
@@ -1,10 +1,15 @@
 """Module implementing game mechanics."""
 
 import os
+import sys
 import abc
 import enum
 import json
 import random
+import functools
+from collections.abc import Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
 
 from .network import Network
 
@@ -22,6 +27,32 @@ PlayerID = int
 
 # Global constants
 GAME_CONFIG_FN = os.path.join('Deadline', 'game_config.json')
+# Config fields holding effect, task and card IDs, which are interned
+ID_FIELDS = frozenset(('eid', 'tid', 'cid', 'task', 'action'))
+
+
+def _intern_ids(pairs: list[tuple[str, any]]) -> dict[str, any]:
+    """
+    Build a config object, interning its IDs.
+
+    Interned IDs make lookups of one object by another's reference, e.g. of a card's task, compare by identity.
+
+    :param pairs: Key-value pairs of a JSON object.
+    :return: The object.
+    """
+    return {key: sys.intern(value) if key in ID_FIELDS else value for key, value in pairs}
+
+
+@functools.cache
+def load_game_config(path: str = GAME_CONFIG_FN) -> MappingProxyType:
+    """
+    Load game config. The file is parsed only once per process; later games reuse the parsed data.
+
+    :param path: Path to the JSON config.
+    :return: Read-only view of the config.
+    """
+    with open(path, 'rb') as f:
+        return MappingProxyType(json.load(f, object_pairs_hook=_intern_ids))
 
 
 class CardTarget(enum.Enum):
@@ -39,36 +70,33 @@ str_to_card_target = {'GLOBAL': CardTarget.GLOBAL,
                       'ANY': CardTarget.ANY}
 
 
+@dataclass(slots=True, frozen=True, eq=False, repr=False)
 class Effect:
-    """An effect applied to the player."""
-
-    def __init__(self, eid: EffectID, name: str, description: str, image: Image,
-                 period: Days, delay: Days, is_removable: bool,
-                 init_events: list[Event], final_events: list[Event], everyday_events: list[Event]):
-        """
-        Construct an effect applied to the player.
-
-        :param eid: Effect ID.
-        :param name: Effect name.
-        :param description: Effect description.
-        :param image: Effect image.
-        :param period: Duration of the effect.
-        :param delay: Delay before the effect starts.
-        :param is_removable: Can the player remove the effect or not.
-        :param init_events: Events that occur at the beginning of the effect.
-        :param final_events: Events that occur at the end of the effect.
-        :param everyday_events: Events that occur every day while the effect is active.
-        """
-        self.eid = eid
-        self.name = name
-        self.description = description
-        self.image = image
-        self.period = period
-        self.delay = delay
-        self.is_removable = is_removable
-        self.init_events = init_events
-        self.final_events = final_events
-        self.everyday_events = everyday_events
+    """
+    An effect applied to the player. Effects are read-only game data.
+
+    :param eid: Effect ID.
+    :param name: Effect name.
+    :param description: Effect description.
+    :param image: Effect image.
+    :param period: Duration of the effect.
+    :param delay: Delay before the effect starts.
+    :param is_removable: Can the player remove the effect or not.
+    :param init_events: Events that occur at the beginning of the effect.
+    :param final_events: Events that occur at the end of the effect.
+    :param everyday_events: Events that occur every day while the effect is active.
+    """
+
+    eid: EffectID
+    name: str
+    description: str
+    image: Image
+    period: Days
+    delay: Days
+    is_removable: bool
+    init_events: list[Event]
+    final_events: list[Event]
+    everyday_events: list[Event]
 
     def __str__(self) -> str:
         """Return user-friendly string representation."""
@@ -87,36 +115,33 @@ class Effect:
         return f'{self.eid} "{self.name}"'
 
 
+@dataclass(slots=True, frozen=True, eq=False, repr=False)
 class Task:
-    """A task that can be given to a player."""
-
-    def __init__(self, tid: TaskID, name: str, description: str, image: Image,
-                 difficulty: Hours, deadline: Days, award: Points, penalty: Points,
-                 events_on_success: list[Event], events_on_fail: list[Event]):
-        """
-        Construct a task that can be given to a player.
-
-        :param tid: Task ID.
-        :param name: Task name.
-        :param description: Task description.
-        :param image: Task image.
-        :param difficulty: Number of hours required to complete the task.
-        :param deadline: Number of days to complete the task.
-        :param award: Number of points awarded for completing the task.
-        :param penalty: Number of points taken away if the task is failed.
-        :param events_on_success: Events that occur if the task is completed.
-        :param events_on_fail: Events that occur if the task is failed.
-        """
-        self.tid = tid
-        self.name = name
-        self.description = description
-        self.image = image
-        self.difficulty = difficulty
-        self.deadline = deadline
-        self.award = award
-        self.penalty = penalty
-        self.events_on_success = events_on_success
-        self.events_on_fail = events_on_fail
+    """
+    A task that can be given to a player. Tasks are read-only game data.
+
+    :param tid: Task ID.
+    :param name: Task name.
+    :param description: Task description.
+    :param image: Task image.
+    :param difficulty: Number of hours required to complete the task.
+    :param deadline: Number of days to complete the task.
+    :param award: Number of points awarded for completing the task.
+    :param penalty: Number of points taken away if the task is failed.
+    :param events_on_success: Events that occur if the task is completed.
+    :param events_on_fail: Events that occur if the task is failed.
+    """
+
+    tid: TaskID
+    name: str
+    description: str
+    image: Image
+    difficulty: Hours
+    deadline: Days
+    award: Points
+    penalty: Points
+    events_on_success: list[Event]
+    events_on_fail: list[Event]
 
     def __str__(self) -> str:
         """Return user-friendly string representation."""
@@ -138,6 +163,8 @@ class Task:
 class Card(abc.ABC):
     """Playing card."""
 
+    __slots__ = ('cid', 'name', 'description', 'image', 'valid_target', 'special')
+
     @abc.abstractmethod
     def __init__(self, cid: CardID, name: str, description: str, image: Image,
                  valid_target: CardTarget | str, special: bool):
@@ -175,6 +202,8 @@ class Card(abc.ABC):
 class TaskCard(Card):
     """Task card - one of the card types."""
 
+    __slots__ = ('task',)
+
     def __init__(self, cid: CardID, name: str, description: str, image: Image,
                  valid_target: CardTarget | str, special: bool, task: TaskID):
         """
@@ -196,6 +225,8 @@ class TaskCard(Card):
 class ActionCard(Card):
     """Action card - one of the card types."""
 
+    __slots__ = ('cost', 'action', 'req_args', 'check_args')
+
     def __init__(self, cid: CardID, name: str, description: str, image: Image,
                  valid_target: CardTarget | str, special: bool, cost: Hours, action: EffectID,
                  req_args: list[str] | None, check_args: str | None):
@@ -222,9 +253,52 @@ class ActionCard(Card):
         self.check_args = check_args
 
 
+@dataclass(slots=True, frozen=True)
+class GameTables:
+    """
+    Read-only game data indexed by ID. It is shared by all games, as none of them changes it.
+
+    :param config: The game config the tables are built from.
+    :param effects: All effects in the game by ID.
+    :param tasks: All tasks in the game by ID.
+    :param cards: All cards in the game by ID.
+    :param deck_cards: IDs of cards that can be dealt into the deck.
+    :param card_types: Card types ('TaskCard' or 'ActionCard') by card ID.
+    """
+
+    config: Mapping[str, any]
+    effects: Mapping[EffectID, Effect]
+    tasks: Mapping[TaskID, Task]
+    cards: Mapping[CardID, Card]
+    deck_cards: tuple[CardID, ...]
+    card_types: Mapping[CardID, str]
+
+
+@functools.cache
+def load_game_tables(path: str = GAME_CONFIG_FN) -> GameTables:
+    """
+    Build the game data tables from the game config. They are built only once per process.
+
+    :param path: Path to the JSON config.
+    :return: Game data tables.
+    """
+    data = load_game_config(path)
+    cards = MappingProxyType({**{dct['cid']: TaskCard(**dct) for dct in data['task_cards']},
+                              **{dct['cid']: ActionCard(**dct) for dct in data['action_cards']}})
+    return GameTables(
+        config=data,
+        effects=MappingProxyType({dct['eid']: Effect(**dct) for dct in data['effects']}),
+        tasks=MappingProxyType({dct['tid']: Task(**dct) for dct in data['tasks']}),
+        cards=cards,
+        deck_cards=tuple(cid for cid, card in cards.items() if not card.special),
+        card_types=MappingProxyType({cid: type(card).__name__ for cid, card in cards.items()}))
+
+
 class Deadline:
     """Player's deadline."""
 
+    __slots__ = ('task', 'init_day', 'deadline', '_rem_hours')
+
     def __init__(self, task: Task, init_day: Day):
         """
         Construct a deadline.
@@ -235,7 +309,12 @@ class Deadline:
         self.task = task
         self.init_day = init_day
         self.deadline: Day = init_day + self.task.deadline  # The day before which the task must be completed
-        self.progress: Hours = 0  # How many hours the player has already worked on the task.
+        self._rem_hours: Hours = self.task.difficulty
+
+    @property
+    def progress(self) -> Hours:
+        """How many hours the player has already worked on the task."""
+        return self.task.difficulty - self._rem_hours
 
     def get_rem_hours(self) -> Hours:
         """
@@ -243,7 +322,7 @@ class Deadline:
 
         :return: Remaining time.
         """
-        return self.task.difficulty - self.progress
+        return self._rem_hours
 
     def work(self, hours: Hours) -> bool:
         """
@@ -252,10 +331,10 @@ class Deadline:
         :param hours: How long to work on the task.
         :return: True if task is completed; otherwise False.
         """
-        assert hours <= self.get_rem_hours()
+        assert hours <= self._rem_hours
 
-        self.progress += hours
-        return self.get_rem_hours() == 0
+        self._rem_hours -= hours
+        return self._rem_hours == 0
 
     def __repr__(self) -> str:
         """Return technical string representation."""
@@ -265,6 +344,8 @@ class Deadline:
 class Player:
     """A player."""
 
+    __slots__ = ('pid', 'name', 'hours_today', 'spent_hours_today', 'score', 'hand', 'deadlines', 'effects')
+
     def __init__(self, pid: PlayerID, name: str, hours_in_day: Hours):
         """
         Construct a player.
@@ -335,6 +416,14 @@ class Player:
 
         self.spent_hours_today += hours
 
+    def spend_time_unchecked(self, hours: Hours):
+        """
+        Spend `hours` hours for something, when the caller has already checked the player has them.
+
+        :param hours: Number of hours to spend.
+        """
+        self.spent_hours_today += hours
+
     def work(self, deadline_idx: int, hours: Hours):
         """
         Work on the task for `hours` hours.
@@ -365,9 +454,19 @@ class Game:
         self._DAYS_IN_TERM: Days  # Number of days in a term; the session starts after that number of days
         self._HOURS_IN_DAY_DEFAULT: Hours  # Number of free hours per day with no effects
         self._HOURS_IN_DAY_MAX: Hours = 24  # Number of max free hours per day with no effects
-        self._ALL_EFFECTS: tuple[Effect, ...]  # All effects in the game
-        self._ALL_TASKS: tuple[Task, ...]  # All tasks in the game
-        self._ALL_CARDS: tuple[Card, ...]  # All cards in the game
+        self._ALL_EFFECTS: Mapping[EffectID, Effect]  # All effects in the game by ID
+        self._ALL_TASKS: Mapping[TaskID, Task]  # All tasks in the game by ID
+        self._ALL_CARDS: Mapping[CardID, Card]  # All cards in the game by ID
+        self._DECK_CARDS: tuple[CardID, ...]  # IDs of cards that can be dealt into the deck
+        self._CARD_TYPES: Mapping[CardID, str]  # Card types ('TaskCard' or 'ActionCard') by card ID
+        # Event handlers by event name, resolved once instead of matching names on every event
+        self._event_handlers = {
+            'special task': self._event_special_task,
+            'add hours': self._event_add_hours,
+            'take card': self._event_take_card,
+            'met opt': self._event_met_opt,
+            'kurs failed': self._event_kurs_failed,
+        }
         # Load basic game data
         self._load_data()
         self._check_consistency()
@@ -379,20 +478,28 @@ class Game:
         self._player = Player(self._player_pid, player_name, self._HOURS_IN_DAY_DEFAULT)
         self._opponent = Player(self._opponent_pid, opponent_name, self._HOURS_IN_DAY_DEFAULT)
         self._players = {self._player_pid: self._player, self._opponent_pid: self._opponent}
+        # Player IDs the player can apply a card to, by card target kind
+        self._target_pids = {CardTarget.GLOBAL: frozenset(),
+                             CardTarget.PLAYER: frozenset((self._player_pid,)),
+                             CardTarget.OPPONENT: frozenset((self._opponent_pid,)),
+                             CardTarget.ANY: frozenset((self._player_pid, self._opponent_pid))}
 
         self._day: Day = 1
         self._have_exams: bool = False
         self._effects: list[tuple[Day, EffectID]] = []
 
-        self._deck: list[CardID]
+        self._deck: list[CardID]  # Cards left in the deck, top card last
 
         self._create_deck()
+        # Random events must turn out the same for both players. Both have the same deck,
+        # so an RNG seeded with it stays in sync without sending a seed over the network.
+        self._rng = random.Random(','.join(self._deck))
         self._deal_cards()
 
     def _load_data(self):
         """Load basic game data."""
-        with open(GAME_CONFIG_FN, 'r') as f:
-            data = json.load(f)
+        tables = load_game_tables()
+        data = tables.config
 
         self._HAND_SIZE = data['HAND_SIZE']
         self._DECK_SIZE = data['DECK_SIZE']
@@ -409,10 +516,11 @@ class Game:
         self._HOURS_IN_DAY_DEFAULT = data['HOURS_IN_DAY_DEFAULT']
         assert self._HOURS_IN_DAY_DEFAULT <= self._HOURS_IN_DAY_MAX
 
-        self._ALL_EFFECTS = {dct['eid']: Effect(**dct) for dct in data['effects']}
-        self._ALL_TASKS = {dct['tid']: Task(**dct) for dct in data['tasks']}
-        self._ALL_CARDS = {dct['cid']: TaskCard(**dct) for dct in data['task_cards']}
-        self._ALL_CARDS.update({dct['cid']: ActionCard(**dct) for dct in data['action_cards']})
+        self._ALL_EFFECTS = tables.effects
+        self._ALL_TASKS = tables.tasks
+        self._ALL_CARDS = tables.cards
+        self._DECK_CARDS = tables.deck_cards
+        self._CARD_TYPES = tables.card_types
 
     def _check_consistency(self):
         """Check the consistency of configurations between players."""
@@ -421,12 +529,12 @@ class Game:
     def _create_deck(self):
         """First player creates a deck of cards and share it with the second one."""
         if self._is_first:
-            self._deck = random.choices([k for k, v in self._ALL_CARDS.items() if not v.special], k=self._DECK_SIZE)
+            self._deck = random.choices(self._DECK_CARDS, k=self._DECK_SIZE)
             self._network.send_deck(self._deck)
         else:
             while 'create_deck' not in self._network.get_active_events():  # todo: мб уйти от активного ожидания
                 pass
-            self._deck = self._network.events_dict['create_deck'].pop(0)
+            self._deck = [sys.intern(cid) for cid in self._network.events_dict['create_deck'].pop(0)]
 
     def _deal_cards(self):
         """Deal cards to players."""
@@ -434,8 +542,9 @@ class Game:
         self._players[1].take_cards_from_deck(self._deck[:self._HAND_SIZE])
         # Deal cards to the second player
         self._players[0].take_cards_from_deck(self._deck[self._HAND_SIZE:2*self._HAND_SIZE])
-        # Remove dealt cards from the deck
-        self._deck = self._deck[2*self._HAND_SIZE:]
+        # Remove dealt cards from the deck. The rest is kept with its top card last,
+        # so drawing a card pops from the end of the list instead of shifting the whole deck.
+        self._deck = self._deck[2*self._HAND_SIZE:][::-1]
 
     """ Getters """
 
@@ -528,11 +637,7 @@ class Game:
         :param cid: Card ID.
         :return: string 'TaskCard' or 'ActionCard'.
         """
-        if isinstance(self._ALL_CARDS[cid], TaskCard):
-            return 'TaskCard'
-        if isinstance(self._ALL_CARDS[cid], ActionCard):
-            return 'ActionCard'
-        raise TypeError
+        return self._CARD_TYPES[cid]
 
     def get_card_targets(self, cid: CardID) -> CardTarget:
         """
@@ -541,7 +646,16 @@ class Game:
         :param cid: Card ID.
         :return: Valid card targets.
         """
-        return self.get_card_info(cid).valid_target
+        return self._ALL_CARDS[cid].valid_target
+
+    def get_card_target_pids(self, cid: CardID) -> frozenset[PlayerID]:
+        """
+        Get IDs of the players the player can apply a card to.
+
+        :param cid: Card ID.
+        :return: Valid target player IDs; empty for global cards.
+        """
+        return self._target_pids[self._ALL_CARDS[cid].valid_target]
 
     def card_idx_to_cid(self, card_idx_in_hand: int) -> CardID:
         """
@@ -675,27 +789,61 @@ class Game:
         :pid: Target player ID.
         """
         for event, args in events:
-            match event:
-                case 'special task':
-                    self._take_special_task(pid, args[0])
-                case 'add hours':
-                    self._players[pid].hours_today += args[0]
-                    if self._players[pid].hours_today > self._HOURS_IN_DAY_MAX:
-                        self._players[pid].hours_today = self._HOURS_IN_DAY_MAX
-                case 'take card':
-                    if len(self._deck) != 0:
-                        self._players[pid].take_cards_from_deck([self._deck.pop(0)])
-                case 'met opt':
-                    if random.randint(1, 3) == 1:
-                        self._players[pid].score += 4
-                    else:
-                        self._take_special_task(pid, args[0])
-                case 'kurs failed':
-                    idx = [deadline.task.tid for deadline in self._players[pid].deadlines].index(args[0])
-                    self._players[pid].score -= self._players[pid].deadlines.pop(idx).get_rem_hours() * 2
-                # case 'ocean of deadlines':
-                #     for deadline in self._players[pid].deadlines:
-                #         deadline.progress -= 1
+            # Events without a handler (e.g. 'ocean of deadlines') are not implemented yet and do nothing
+            handler = self._event_handlers.get(event)
+            if handler is not None:
+                handler(pid, args)
+
+    def _event_special_task(self, pid: PlayerID, args: list):
+        """
+        Give a player a special task.
+
+        :param pid: Target player ID.
+        :param args: Task ID.
+        """
+        self._take_special_task(pid, args[0])
+
+    def _event_add_hours(self, pid: PlayerID, args: list):
+        """
+        Give a player more free hours today, up to the daily maximum.
+
+        :param pid: Target player ID.
+        :param args: Number of hours.
+        """
+        player = self._players[pid]
+        player.hours_today = min(player.hours_today + args[0], self._HOURS_IN_DAY_MAX)
+
+    def _event_take_card(self, pid: PlayerID, args: list):
+        """
+        Let a player take a card from the deck, if there are any left.
+
+        :param pid: Target player ID.
+        :param args: No args.
+        """
+        if len(self._deck) != 0:
+            self._players[pid].take_cards_from_deck([self._deck.pop()])
+
+    def _event_met_opt(self, pid: PlayerID, args: list):
+        """
+        Either award a player or give them a special task, at random.
+
+        :param pid: Target player ID.
+        :param args: Task ID.
+        """
+        if self._rng.randint(1, 3) == 1:
+            self._players[pid].score += 4
+        else:
+            self._take_special_task(pid, args[0])
+
+    def _event_kurs_failed(self, pid: PlayerID, args: list):
+        """
+        Remove a failed task from a player's deadlines, taking away points for the remaining work.
+
+        :param pid: Target player ID.
+        :param args: Task ID.
+        """
+        idx = [deadline.task.tid for deadline in self._players[pid].deadlines].index(args[0])
+        self._players[pid].score -= self._players[pid].deadlines.pop(idx).get_rem_hours() * 2
 
     def _take_card(self, actor_pid: PlayerID):
         """
@@ -705,7 +853,7 @@ class Game:
         """
         assert self._can_take_card(actor_pid)['res']
 
-        self._players[actor_pid].take_cards_from_deck([self._deck.pop(0)])
+        self._players[actor_pid].take_cards_from_deck([self._deck.pop()])
 
         if actor_pid == self._player_pid:
             self._player_took_card = True
@@ -740,13 +888,14 @@ class Game:
         :param target_cid: Target card ID (if card is applied to a specific player card).
         """
         cid = self._players[actor_pid].use_card(card_idx_in_hand)
+        # The card's cost is checked here, so it is spent below without checking again
         assert self._can_use_card(actor_pid, cid)['res']
 
         card = self._ALL_CARDS[cid]
         if card.valid_target == CardTarget.GLOBAL:
             if self.get_card_type(cid) != 'ActionCard':
                 raise TypeError
-            self._players[actor_pid].spend_time(card.cost)
+            self._players[actor_pid].spend_time_unchecked(card.cost)
             self._effects.append((self._day, card.action))
 
             effect = self._ALL_EFFECTS[card.action]
@@ -754,7 +903,7 @@ class Game:
                 self._events(effect.init_events, actor_pid)
         else:
             if self.get_card_type(cid) == 'ActionCard':
-                self._players[actor_pid].spend_time(card.cost)
+                self._players[actor_pid].spend_time_unchecked(card.cost)
                 real_target_pid = target_pid if target_pid is not None else actor_pid
                 self._players[real_target_pid].effects.append((self._day, card.action))
 
@@ -817,44 +966,83 @@ class Game:
         """
         self._spend_time(self._opponent_pid, target_deadline_idx, hours)
 
-    def turn_begin(self):
-        """Actions performed at the beginning of a turn."""
-        self._player_took_card = False
-        self._opponent_took_card = False
+    def _settle_deadlines(self, pid: PlayerID, completed: bool):
+        """
+        Award or penalize settled deadlines of a player, then remove them in one pass.
 
-        # Check opponent completed deadlines
-        for idx, deadline in enumerate(self._opponent.deadlines):
-            if deadline.get_rem_hours() == 0:
-                self._opponent.score += deadline.task.award
-                self._events(deadline.task.events_on_success, self._opponent_pid)
-                self._opponent.deadlines.pop(idx)
+        The events of a settled deadline run while it is still in the player's deadlines,
+        as some of them (e.g. 'kurs failed') act on it there.
 
-        self._player.hours_today = self._HOURS_IN_DAY_DEFAULT
-        self._player.spent_hours_today = 0
+        :param pid: Target player ID.
+        :param completed: True to award completed tasks; False to penalize the tasks due today.
+        """
+        player = self._players[pid]
+        day = self._day
+        settled = [deadline for deadline in player.deadlines
+                   if (deadline.get_rem_hours() == 0 if completed else deadline.deadline == day)]
+        if not settled:
+            return
 
-        for init_day, eid in self._player.effects + self._effects:
-            effect = self._ALL_EFFECTS[eid]
-            if self._day == init_day + effect.delay:
-                self._events(effect.init_events, self._player_pid)
-            elif self._day == init_day + effect.delay + effect.period:
-                self._events(effect.final_events, self._player_pid)
+        for deadline in settled:
+            if completed:
+                player.score += deadline.task.award
+                self._events(deadline.task.events_on_success, pid)
             else:
-                self._events(effect.everyday_events, self._player_pid)
+                player.score += deadline.task.penalty
+                self._events(deadline.task.events_on_fail, pid)
+        # Events may have removed settled deadlines or added new ones, so only the settled ones still left are dropped
+        settled_ids = {id(deadline) for deadline in settled}
+        player.deadlines[:] = [deadline for deadline in player.deadlines if id(deadline) not in settled_ids]
 
-        for idx, (init_day, eid) in enumerate(self._player.effects):
-            effect = self._ALL_EFFECTS[eid]
-            if self._day == init_day + effect.delay + effect.period:
-                self._player.effects.pop(idx)
-        for idx, (init_day, eid) in enumerate(self._effects):
+    def _tick_effects(self, effects: list[tuple[Day, EffectID]], pid: PlayerID | None):
+        """
+        Activate today's events of effects and drop the effects that end today, in one pass.
+
+        :param effects: Effects by the days they were applied.
+        :param pid: Target player ID, or None to only drop the ended effects.
+        """
+        day = self._day
+        ongoing = []
+        for init_day, eid in effects:
             effect = self._ALL_EFFECTS[eid]
-            if self._day == init_day + effect.delay + effect.period:
-                self._effects.pop(idx)
+            start_day = init_day + effect.delay
+            end_day = start_day + effect.period
+            if pid is not None:
+                if day == start_day:
+                    self._events(effect.init_events, pid)
+                elif day == end_day:
+                    self._events(effect.final_events, pid)
+                else:
+                    self._events(effect.everyday_events, pid)
+            if day != end_day:
+                ongoing.append((init_day, eid))
+        effects[:] = ongoing
+
+    def _start_day(self, pid: PlayerID, fire_global_effects: bool):
+        """
+        Start a player's day: restore their hours, tick the effects and settle the deadlines due today.
 
-        for idx, deadline in enumerate(self._player.deadlines):
-            if deadline.deadline == self._day:
-                self._player.score += deadline.task.penalty
-                self._events(deadline.task.events_on_fail, self._player_pid)
-                self._player.deadlines.pop(idx)
+        :param pid: Target player ID.
+        :param fire_global_effects: Whether global effects fire their events for the player.
+            Either way, global effects that end today are dropped.
+        """
+        player = self._players[pid]
+        player.hours_today = self._HOURS_IN_DAY_DEFAULT
+        player.spent_hours_today = 0
+
+        self._tick_effects(player.effects, pid)
+        self._tick_effects(self._effects, pid if fire_global_effects else None)
+
+        self._settle_deadlines(pid, completed=False)
+
+    def turn_begin(self):
+        """Actions performed at the beginning of a turn."""
+        self._player_took_card = False
+        self._opponent_took_card = False
+
+        # Check opponent completed deadlines
+        self._settle_deadlines(self._opponent_pid, completed=True)
+        self._start_day(self._player_pid, True)
 
     def turn_end(self) -> str:
         """
@@ -864,38 +1052,8 @@ class Game:
         """
         self._day += 1
 
-        for idx, deadline in enumerate(self._player.deadlines):
-            if deadline.get_rem_hours() == 0:
-                self._player.score += deadline.task.award
-                self._events(deadline.task.events_on_success, self._player_pid)
-                self._player.deadlines.pop(idx)
-
-        self._opponent.hours_today = self._HOURS_IN_DAY_DEFAULT
-        self._opponent.spent_hours_today = 0
-
-        for init_day, eid in self._opponent.effects:
-            effect = self._ALL_EFFECTS[eid]
-            if self._day == init_day + effect.delay:
-                self._events(effect.init_events, self._opponent_pid)
-            elif self._day == init_day + effect.delay + effect.period:
-                self._events(effect.final_events, self._opponent_pid)
-            else:
-                self._events(effect.everyday_events, self._opponent_pid)
-
-        for idx, (init_day, eid) in enumerate(self._opponent.effects):
-            effect = self._ALL_EFFECTS[eid]
-            if self._day == init_day + effect.delay + effect.period:
-                self._opponent.effects.pop(idx)
-        for idx, (init_day, eid) in enumerate(self._effects):
-            effect = self._ALL_EFFECTS[eid]
-            if self._day == init_day + effect.delay + effect.period:
-                self._effects.pop(idx)
-
-        for idx, deadline in enumerate(self._opponent.deadlines):
-            if deadline.deadline == self._day:
-                self._opponent.score += deadline.task.penalty
-                self._events(deadline.task.events_on_fail, self._opponent_pid)
-                self._opponent.deadlines.pop(idx)
+        self._settle_deadlines(self._player_pid, completed=True)
+        self._start_day(self._opponent_pid, False)
 
         if self._player.score >= self._WIN_THRESHOLD:
             return 'win'
@@ -10,6 +10,17 @@ LOCALES = {
     ("en_US", "UTF-8"): gettext.NullTranslations(),
 }
 
+# Lookup of the current locale's translation, switched only by set_locale() instead of querying the locale
+# on every lookup. The bound method is kept, so a lookup is a single catalog access.
+_gettext = LOCALES.get(locale.getlocale(), translation).gettext
+
+
+def set_locale(loc):
+    """Switch the process locale and the translation used by `_`."""
+    global _gettext
+    locale.setlocale(locale.LC_ALL, loc)
+    _gettext = LOCALES[loc].gettext
+
 
 def _(text):
-    return LOCALES[locale.getlocale()].gettext(text)
+    return _gettext(text)
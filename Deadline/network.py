@@ -3,7 +3,7 @@ import threading
 import subprocess
 import time
 import re
-from typing import List,  Dict
+from typing import Callable, List, Dict, Optional
 
 from colors import strip_color
 
@@ -52,6 +52,8 @@ class Network:
         TIMEOUT (int): Timeout value in seconds for connection attempts
         buffer_size (int): Buffer size in bytes for receiving messages
         events_dict (str): Queue of messages that were received, but not processed
+        on_connected (Callable): Called (possibly from a worker thread) when a connection is established
+        on_host_ready (Callable): Called (possibly from a worker thread) when the external address of the host is known
 
     """
 
@@ -76,6 +78,14 @@ class Network:
             "quit": [],
             "create_deck": []
         }
+        self.on_connected: Optional[Callable[[], None]] = None
+        self.on_host_ready: Optional[Callable[[], None]] = None
+
+    @staticmethod
+    def _notify(callback: Optional[Callable[[], None]]) -> None:
+        """Call a notification callback if it is set."""
+        if callback is not None:
+            callback()
 
     def connect_to_host(self, host: str, port: str):
         """
@@ -89,21 +99,21 @@ class Network:
             port (str): Port number on the host to connect to
 
         Raises
-            Exception: Raised when connection fails for any reason
+            OSError: Raised when connection fails
 
         """
         self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        # Messages are small and each one is waited for by the peer, so they must not be held back by Nagle
+        self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
         self.socket.setblocking(False)
-        try:
-            while True:
-                try:
-                    self.socket.connect((host, port))
-                    self.connection = True
-                    break
-                except BlockingIOError:
-                    pass
-        except Exception as e:
-            raise Exception(_(f"Error: {e}"))
+        while True:
+            try:
+                self.socket.connect((host, port))
+                self.connection = True
+                self._notify(self.on_connected)
+                break
+            except BlockingIOError:
+                pass
 
     def _accept_connection(self):
         """
@@ -114,8 +124,10 @@ class Network:
         communication socket and marks the connection as established.
         """
         self.socket, self.client_address = self.server_socket.accept()
+        self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
         self.socket.setblocking(False)
         self.connection = True
+        self._notify(self.on_connected)
 
     def _get_bore_output(self, process):
         """
@@ -147,6 +159,7 @@ class Network:
                     match = re.search(r"remote_port=(\d+)", output)
                     if match:
                         self.external_port = int(match.group(1))
+                        self._notify(self.on_host_ready)
                         return
             except Exception as e:
                 raise ValueError(_("Error reading bore output:") + str(e))
@@ -190,16 +203,9 @@ class Network:
 
         Note:
             When use_bore_flag is True, the method sets up external access via bore.pub so bore should be installed.
+            The external port is then known only when the tunnel is up.
 
         """
-        if not use_bore_flag:
-            external_ip = "0.0.0.0"
-            external_port = port
-        else:
-            external_ip = 'bore.pub'
-            self._run_bore_tunnel(port)
-            external_port = self.external_port
-
         self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self.server_socket.bind(("", port))
         self.server_socket.listen()
@@ -208,7 +214,13 @@ class Network:
             daemon=True
         )
         connection_thread.start()
-        self.external_ip, self.external_port = external_ip, external_port
+
+        if not use_bore_flag:
+            self.external_ip, self.external_port = "0.0.0.0", port
+            self._notify(self.on_host_ready)
+        else:
+            self.external_ip = 'bore.pub'
+            self._run_bore_tunnel(port)
 
     def send_msg(self, msg: str):
         """
@@ -218,12 +230,14 @@ class Network:
             msg (str): The message string to send to the connected peer
 
         """
-        while True:
-            try:
-                self.socket.send(msg.encode())
-                break
-            except BlockingIOError:
-                pass
+        with memoryview(msg.encode()) as data:
+            sent = 0
+            while sent < len(data):
+                try:
+                    # The socket is non-blocking, so it may take only a part of the data at a time
+                    sent += self.socket.send(data[sent:])
+                except BlockingIOError:
+                    pass
 
     def send_deck(self, deck) -> None:
         """Send created to oppennt.
@@ -251,16 +265,10 @@ class Network:
             if not data:
                 return None
 
-            self._recv_buffer += data
-            msg_count = self._recv_buffer.count(b"\n")
-            valid_messages = self._recv_buffer.split(b"\n", msg_count)
-            if self._recv_buffer[-1] == b'\n':
-                self._recv_buffer = ''
-            else:
-                self._recv_buffer = valid_messages[-1]
-                valid_messages = valid_messages[:-1:]
+            # Complete messages end with a newline; the last piece is the start of an incomplete one, if any
+            *valid_messages, self._recv_buffer = (self._recv_buffer + data).split(b"\n")
             for msg in valid_messages:
-                if len(msg):
+                if msg:
                     self.add_event(msg.decode())
 
         except BlockingIOError:
@@ -304,7 +312,7 @@ class Network:
 
         """
         self.check_for_message()
-        return [key for key in self.events_dict if len(self.events_dict[key])]
+        return [key for key, queue in self.events_dict.items() if queue]
 
     def add_event(self, msg: str) -> None:
         """Add Event to events dict.
@@ -318,7 +326,7 @@ class Network:
         args = []
         if len(msg_split) > 1:
             args = msg_split[1:]
-        self.events_dict[event] = self.events_dict.get(event, []) + [args]
+        self.events_dict.setdefault(event, []).append(args)
 
     def close_client_socket(self):
         """Close the client/peer socket connection."""
@@ -1,10 +1,10 @@
 import abc
+import functools
+import re
 import pygame as pg
-import locale
 from .game import Game, Text, Anchor, TextField, BackButton, ChooseLanguageButton, \
-    SceneSwitchButton, ExitButton, ConnectButton, CheckBoxButton, Card
-from .game import _
-import Deadline.game_logic as gl
+    SceneSwitchButton, ExitButton, ConnectButton, CheckBoxButton, Card, load_texture
+from .game import _, NET_CONNECTED, NET_HOST_READY
 import os
 
 
@@ -18,6 +18,9 @@ class Scene(abc.ABC):
 
     """
 
+    __slots__ = ('game', 'buttons', 'texts', '_run_steps', '_full_redraw', '_draw_version', '_visible_version',
+                 '_drawables', '_visible_drawables', '_network_stale')
+
     def __init__(self, game: Game):
         """Initialize scene.
 
@@ -26,13 +29,114 @@ class Scene(abc.ABC):
 
         """
         self.game = game
+        # Frame phases bound once, so run() doesn't look them up every frame
+        self._run_steps = (self.check_events, self.update_scene, self.draw_scene)
+        self._full_redraw = True
+        self._draw_version = 0  # Bumped whenever the set of visible widgets changes
+        self._visible_version = -1
+        self._network_stale = True  # Network events may have been missed while the scene wasn't running
+
+    def invalidate(self):
+        """Make the next frame repaint the whole screen."""
+        self._full_redraw = True
+        self._network_stale = True
+
+    def _network_changed(self, *event_types) -> bool:
+        """Check whether the network state must be read again.
+
+        The events only wake the scene up: they are lost while another scene or an error popup runs,
+        so the state is also read on the first frame and after `invalidate()`.
+
+        Args:
+            event_types: Network event types the scene reacts to.
+
+        """
+        if self._network_stale or any(event_type in self.game.events for event_type in event_types):
+            self._network_stale = False
+            return True
+        return False
+
+    def _rebuild_drawables(self):
+        """Rebuild the tuple of widgets updated and drawn every frame.
+
+        Scenes keeping `buttons` and `texts` lists call this whenever the lists' membership changes.
+        """
+        self._drawables = tuple(self.buttons) + tuple(self.texts)
+        self._draw_version += 1
+
+    def _set_visible(self, obj, visible):
+        """Show or hide a widget of the scene."""
+        if obj.visible != visible:
+            obj.visible = visible
+            obj.dirty = True
+            self._draw_version += 1
+
+    def _get_visible_drawables(self):
+        """Get the widgets to draw, in draw order. The list is rebuilt only when the draw version changes."""
+        if self._visible_version != self._draw_version:
+            self._visible_drawables = [obj for obj in self._drawables if obj.visible]
+            self._visible_version = self._draw_version
+        return self._visible_drawables
+
+    def _render_background(self, bg_color) -> pg.Surface:
+        """Pre-render the scene with every widget in its current (idle) look, for `_draw_dirty()`."""
+        background = self.game.canvas.copy()
+        background.fill(bg_color)
+        for obj in self._get_visible_drawables():
+            obj.draw(background)
+        return background
+
+    def _repaint(self, rect, visible, bg_color, background):
+        """Repaint a region of the canvas.
+
+        The region is restored from `background` with a single blit if every widget over it is idle,
+        otherwise it's cleared and the overlapping widgets are redrawn.
+        """
+        overlapping = [obj for obj in visible if obj.rect.colliderect(rect)]
+        if background is not None and all(obj.is_idle() for obj in overlapping):
+            self.game.canvas.blit(background, rect, rect)
+            return
+        self.game.canvas.fill(bg_color, rect)
+        for obj in overlapping:
+            obj.draw()
+
+    def _draw_dirty(self, bg_color, background=None):
+        """Repaint only the widgets whose appearance has changed since the last frame.
+
+        The whole screen is repainted after `invalidate()`. Otherwise each dirty widget's
+        region is cleared, every widget overlapping it is redrawn, and only these regions
+        are pushed to the display. Clean frames do nothing at all.
+
+        Args:
+            bg_color: Background color of the scene.
+            background: Scene pre-rendered by `_render_background()`, if the scene keeps one.
+                The widgets must not change their idle look or position while it's in use.
+
+        """
+        canvas = self.game.canvas
+        visible = self._get_visible_drawables()
+        if self._full_redraw:
+            self._repaint(canvas.get_rect(), visible, bg_color, background)
+            rects = None
+        else:
+            rects = [obj.rect.union(obj.last_rect) for obj in self._drawables if obj.dirty]
+            if not rects:
+                return
+            for rect in rects:
+                canvas.set_clip(rect)
+                self._repaint(rect, visible, bg_color, background)
+            canvas.set_clip(None)
+
+        for obj in self._drawables:
+            obj.dirty = False
+            obj.last_rect = obj.rect.copy()
+        self._full_redraw = False
+        self.game.blit_screen(rects)
 
-    @abc.abstractmethod
     def run(self):
         """Run main scene loop method that coordinates event checking, updating and drawing."""
-        self.check_events()
-        self.update_scene()
-        self.draw_scene()
+        for step in self._run_steps:
+            step()
 
     @abc.abstractmethod
     def check_events(self):
@@ -50,6 +154,47 @@ class Scene(abc.ABC):
         pass
 
 
+_PORT_RE = re.compile(r'[0-9]{1,5}')
+# A dotted IPv4 address or a host name, e.g. the bore.pub tunnel host
+_HOST_RE = re.compile(r'[A-Za-z0-9]([A-Za-z0-9-]{0,61}[A-Za-z0-9])?(\.[A-Za-z0-9]([A-Za-z0-9-]{0,61}[A-Za-z0-9])?)*')
+
+
+def parse_port(value: str) -> int:
+    """
+    Parse port number entered by user.
+
+    Args:
+        value (str): Entered value.
+
+    Raises
+        ValueError: If the value is not a valid port number.
+
+    """
+    if _PORT_RE.fullmatch(value) is None or not 0 < int(value) < 65536:
+        raise ValueError(_("Port must be a number from 1 to 65535!"))
+    return int(value)
+
+
+def parse_host(value: str) -> str:
+    """
+    Parse host address entered by user.
+
+    Args:
+        value (str): Entered value.
+
+    Raises
+        ValueError: If the value is not an IP address or a host name.
+
+    """
+    host = value.strip()
+    if _HOST_RE.fullmatch(host) is None:
+        raise ValueError(_("Enter IP address of the host!"))
+    return host
+
+
+MENU_FONT_SIZE = 80
+
+
 textures = os.path.join(os.path.dirname(__file__), "textures")
 STICKYNOTE_BUTTON_IMAGES_PATHS = [f"{textures}/button_idle.png",
                                   f"{textures}/button_hover.png", f"{textures}/button_pressed.png"]
@@ -63,6 +208,8 @@ class MainMenu(Scene):
 
     """
 
+    __slots__ = ('stickynote_button_images', 'title', '_background')
+
     def __init__(self, game):
         """Initialize Main Menu scene.
 
@@ -71,115 +218,45 @@ class MainMenu(Scene):
 
         """
         super().__init__(game)
+        layout = self.game.layout
+        left_x, right_x, row = layout['left_x'], layout['right_x'], layout['row']
         pg.display.set_caption(_('Deadline - Main menu'))
 
-        self.stickynote_button_images = list(map(pg.image.load, STICKYNOTE_BUTTON_IMAGES_PATHS))
+        self.stickynote_button_images = [load_texture(path) for path in STICKYNOTE_BUTTON_IMAGES_PATHS]
 
         self.title = Text(
             game,
-            (self.game.window_size[0] // 2, self.game.window_size[1] // 8),
+            layout['title'],
             Anchor.CENTRE,
             _("Deadline"),
             150)
 
-        button_text = Text(
-            game,
-            (0, 0),
-            Anchor.CENTRE,
-            _("Host game"),
-            80)
-
-        self.button_host_game = SceneSwitchButton(
-            game,
-            HostScene,
-            (600, 325),
-            (self.game.window_size[0] // 3, self.game.window_size[1] // 16 * 6),
-            Anchor.CENTRE,
-            self.stickynote_button_images,
-            button_text,
-            Anchor.CENTRE)
-
-        button_text = Text(
-            game,
-            (0, 0),
-            Anchor.CENTRE,
-            _("Connect"),
-            80)
-
-        self.button_connect = SceneSwitchButton(
-            game,
-            ConnectScene,
-            (600, 325),
-            (self.game.window_size[0] // 3, self.game.window_size[1] // 16 * 12),
-            Anchor.CENTRE,
-            self.stickynote_button_images,
-            button_text,
-            Anchor.CENTRE)
-
-        button_text = Text(
-            game,
-            (0, 0),
-            Anchor.CENTRE,
-            _("Settings"),
-            80)
-
-        self.button_settings = SceneSwitchButton(
-            game,
-            SettingsScene,
-            (600, 325),
-            (self.game.window_size[0] // 3 * 2, self.game.window_size[1] // 16 * 6),
-            Anchor.CENTRE,
-            self.stickynote_button_images,
-            button_text,
-            Anchor.CENTRE)
-
-        button_text = Text(
-            game,
-            (0, 0),
-            Anchor.CENTRE,
-            _("Exit"),
-            80)
-
-        self.button_exit = ExitButton(
-            game,
-            (600, 325),
-            (self.game.window_size[0] // 3 * 2, self.game.window_size[1] // 16 * 12),
-            Anchor.CENTRE,
-            self.stickynote_button_images,
-            button_text,
-            Anchor.CENTRE)
-
-    def run(self):
-        """Run main scene loop method that coordinates event checking, updating and drawing."""
-        self.check_events()
-        self.update_scene()
-        self.draw_scene()
+        self.buttons = []
+        for label, pos, make_button in (
+                (_("Host game"), (left_x, row * 6), functools.partial(SceneSwitchButton, game, HostScene)),
+                (_("Connect"), (left_x, row * 12), functools.partial(SceneSwitchButton, game, ConnectScene)),
+                (_("Settings"), (right_x, row * 6), functools.partial(SceneSwitchButton, game, SettingsScene)),
+                (_("Exit"), (right_x, row * 12), functools.partial(ExitButton, game))):
+            text = Text(game, (0, 0), Anchor.CENTRE, label, MENU_FONT_SIZE)
+            self.buttons.append(make_button((600, 325), pos, Anchor.CENTRE,
+                                            self.stickynote_button_images, text, Anchor.CENTRE))
+        self.texts = [self.title]
+        self._rebuild_drawables()
+        self._background = self._render_background((255, 255, 255))
 
     def check_events(self):
         """Process input events for all UI buttons."""
-        self.button_host_game.check_event()
-        self.button_connect.check_event()
-        self.button_settings.check_event()
-        self.button_exit.check_event()
+        for button in self.buttons:
+            button.check_event()
 
     def update_scene(self):
         """Update the scene state (game logic, animations, etc.)."""
-        self.button_host_game.update()
-        self.button_connect.update()
-        self.button_settings.update()
-        self.button_exit.update()
+        for button in self.buttons:
+            button.update()
 
     def draw_scene(self):
         """Render the main menu: background, title, and buttons."""
-        self.game.canvas.fill((255, 255, 255))
-
-        self.title.draw()
-        self.button_host_game.draw()
-        self.button_connect.draw()
-        self.button_settings.draw()
-        self.button_exit.draw()
-
-        self.game.blit_screen()
+        self._draw_dirty((255, 255, 255), self._background)
 
 
 class HostScene(Scene):
@@ -192,6 +269,8 @@ class HostScene(Scene):
     - Returning to main menu
     """
 
+    __slots__ = ('bore_checkbox', 'host_button', 'port_field', '_waiting_text', '_waiting_key')
+
     def __init__(self, game):
         """Initialize the host game scene.
 
@@ -200,6 +279,8 @@ class HostScene(Scene):
 
         """
         super().__init__(game)
+        layout = self.game.layout
+        col, row = layout['col'], layout['row']
         pg.display.set_caption(_('Deadline - Host game'))
         self.buttons = []
 
@@ -207,7 +288,7 @@ class HostScene(Scene):
             game,
             MainMenu))
 
-        checkbox_pos = self.game.window_size[0] // 32 * 11, self.game.window_size[1] // 16 * 8
+        checkbox_pos = col * 11, row * 8
         checkbox_text = Text(
             game,
             (checkbox_pos[0] + 70, checkbox_pos[1] + 15),
@@ -227,13 +308,13 @@ class HostScene(Scene):
 
         self.host_button = ConnectButton(game,
                                          size=(600, 120),
-                                         pos=(self.game.window_size[0] // 32 * 16, self.game.window_size[1] // 16 * 7),
+                                         pos=(col * 16, row * 7),
                                          anchor=Anchor.CENTRE,
                                          text=connect_button_text)
 
         self.port_field = TextField(game,
                                     size=(200, 120),
-                                    pos=(self.game.window_size[0] // 32 * 16, self.game.window_size[1] // 16 * 5),
+                                    pos=(col * 16, row * 5),
                                     anchor=Anchor.CENTRE,
                                     max_length=5,
                                     placeholder=_('Enter Port')
@@ -243,55 +324,51 @@ class HostScene(Scene):
         self.texts = []
         self.texts.append(Text(
             game,
-            (self.game.window_size[0] // 2, self.game.window_size[1] // 8),
+            layout['title'],
             Anchor.CENTRE,
             _("Host Game"),
             150))
         self.texts.append(checkbox_text)
-
-    def run(self):
-        """Execute one frame of the scene logic."""
-        self.check_events()
-        self.update_scene()
-        self.draw_scene()
+        self._waiting_text = Text(
+            game,
+            layout['status'],
+            Anchor.CENTRE,
+            _("Waiting for connection on "),
+            40)
+        self._waiting_text.visible = False
+        self._waiting_key = None  # (ip, port) shown by the waiting text
+        self.texts.append(self._waiting_text)
+        self._rebuild_drawables()
 
     def check_events(self):
         """Process input events for all UI buttons."""
         for button in self.buttons:
             button.check_event()
         if self.host_button.mousedown:
-            try:
-                port = int(self.port_field.value)
-                self.game.network.run_host(port, use_bore_flag=self.bore_checkbox.clicked)
-                print("Успех!")
-            except Exception as e:
-                print("Ой-ё-ё-юшки, что-то пошло совсем не так!", e)
             self.host_button.mousedown = False
             self.host_button.mousehold = False
-        if self.game.network.external_port:
-            waiting_for_connection_msg = _("Waiting for connection on ") + \
-                str(self.game.network.external_ip) + ":" + str(self.game.network.external_port)
-            waiting_for_connection_text = Text(
-                self.game,
-                (self.game.window_size[0] // 2, self.game.window_size[1] // 4 * 3),
-                Anchor.CENTRE,
-                waiting_for_connection_msg,
-                40)
-            self.texts.append(waiting_for_connection_text)
+            port = parse_port(self.port_field.value)
+            if not self.host_button.busy:
+                self.host_button.run_task(self.game.network.run_host, port, self.bore_checkbox.clicked)
+        if self._network_changed(NET_HOST_READY, NET_CONNECTED):
+            network = self.game.network
+            if network.external_port:
+                key = (network.external_ip, network.external_port)
+                if key != self._waiting_key:
+                    self._waiting_key = key
+                    self._waiting_text.set_text(_("Waiting for connection on ") + f"{key[0]}:{key[1]}")
+                self._set_visible(self._waiting_text, True)
+            if network.connection:
+                self.game.current_scene = GameScene(self.game, is_first=True)
 
     def update_scene(self):
         """Update the scene state (game logic, animations, etc.)."""
-        for object in self.buttons + self.texts:
-            object.update()
-        if self.game.network.connection:
-            self.game.current_scene = GameScene(self.game, is_first=True)
+        for button in self.buttons:
+            button.update()
 
     def draw_scene(self):
         """Render the main menu: background, title, and buttons."""
-        self.game.canvas.fill("white")
-        for object in self.buttons + self.texts:
-            object.draw()
-        self.game.blit_screen()
+        self._draw_dirty("white")
 
 
 class ConnectScene(Scene):
@@ -303,6 +380,8 @@ class ConnectScene(Scene):
     - Returning to main menu
     """
 
+    __slots__ = ('connect_button', 'ip_field', 'port_field')
+
     def __init__(self, game):
         """Initialize the connection scene.
 
@@ -311,6 +390,8 @@ class ConnectScene(Scene):
 
         """
         super().__init__(game)
+        layout = self.game.layout
+        col, row = layout['col'], layout['row']
         pg.display.set_caption(_('Deadline - Connect'))
         self.buttons = []
 
@@ -327,20 +408,19 @@ class ConnectScene(Scene):
 
         self.connect_button = ConnectButton(game,
                                             size=(600, 120),
-                                            pos=(self.game.window_size[0] // 32 * 14,
-                                                 self.game.window_size[1] // 16 * 7),
+                                            pos=(col * 14, row * 7),
                                             anchor=Anchor.CENTRE,
                                             text=connect_button_text)
 
         self.ip_field = TextField(game,
                                   size=(600, 120),
-                                  pos=(self.game.window_size[0] // 32 * 14, self.game.window_size[1] // 16 * 5),
+                                  pos=(col * 14, row * 5),
                                   anchor=Anchor.CENTRE,
                                   placeholder=_('Enter IP')
                                   )
         self.port_field = TextField(game,
                                     size=(200, 120),
-                                    pos=(self.game.window_size[0] // 32 * 21, self.game.window_size[1] // 16 * 5),
+                                    pos=(col * 21, row * 5),
                                     anchor=Anchor.CENTRE,
                                     max_length=5,
                                     placeholder=_('Enter Port')
@@ -350,48 +430,34 @@ class ConnectScene(Scene):
         self.texts = []
         self.texts.append(Text(
             game,
-            (self.game.window_size[0] // 2, self.game.window_size[1] // 8),
+            layout['title'],
             Anchor.CENTRE,
             _("Connect"),
             150))
-
-    def run(self):
-        """Execute one frame of the scene logic."""
-        self.check_events()
-        self.update_scene()
-        self.draw_scene()
+        self._rebuild_drawables()
 
     def check_events(self):
         """Process input events for all UI buttons."""
         for button in self.buttons:
             button.check_event()
         if self.connect_button.mousedown:
-            try:
-                host = self.ip_field.value
-                port = int(self.port_field.value)
-                self.game.network.connect_to_host(host, port)
-                print("Успех!")
-            except Exception as e:
-                print("Ой-ё-ё-юшки, что-то пошло совсем не так!", e)
-                self.connect_button.mousedown = False
-                self.connect_button.mousehold = False
-                raise Exception(e)
             self.connect_button.mousedown = False
             self.connect_button.mousehold = False
+            host = parse_host(self.ip_field.value)
+            port = parse_port(self.port_field.value)
+            if not self.connect_button.busy:
+                self.connect_button.run_task(self.game.network.connect_to_host, host, port)
+        if self._network_changed(NET_CONNECTED) and self.game.network.connection:
+            self.game.current_scene = GameScene(self.game, is_first=False)
 
     def update_scene(self):
         """Update the scene state (game logic, animations, etc.)."""
-        for object in self.buttons + self.texts:
-            object.update()
-        if self.game.network.connection:
-            self.game.current_scene = GameScene(self.game, is_first=False)
+        for button in self.buttons:
+            button.update()
 
     def draw_scene(self):
         """Render the main menu: background, title, and buttons."""
-        self.game.canvas.fill("white")
-        for object in self.buttons + self.texts:
-            object.draw()
-        self.game.blit_screen()
+        self._draw_dirty("white")
 
 
 class SettingsScene(Scene):
@@ -402,6 +468,8 @@ class SettingsScene(Scene):
     - Returning to main menu
     """
 
+    __slots__ = ()
+
     def __init__(self, game):
         """Initialize settings scene with UI elements.
 
@@ -411,17 +479,16 @@ class SettingsScene(Scene):
         Attributes
             buttons (list): Collection of interactive UI buttons
             texts (list): Collection of text elements
-            cur_locale (tuple): Current locale settings (language, encoding)
 
         """
         super().__init__(game)
+        layout = self.game.layout
         pg.display.set_caption(_('Deadline - Settings'))
         self.buttons = []
         self.texts = []
-        self.cur_locale = locale.getlocale()
         self.texts.append(Text(
             game,
-            (self.game.window_size[0] // 2, self.game.window_size[1] // 8),
+            layout['title'],
             Anchor.CENTRE,
             _("Settings"),
             150))
@@ -431,44 +498,42 @@ class SettingsScene(Scene):
             MainMenu))
         self.buttons.append(ChooseLanguageButton(game,
                                                  (600, 120),
-                                                 (self.game.window_size[0] // 2, self.game.window_size[1] // 16 * 9),
-                                                 Anchor.CENTRE))
-
-    def run(self):
-        """Execute one frame of the scene logic."""
-        self.check_events()
-        self.update_scene()
-        self.draw_scene()
+                                                 (layout['centre_x'], layout['row'] * 9),
+                                                 Anchor.CENTRE,
+                                                 self._rebuild_title))
+        self._rebuild_drawables()
 
     def check_events(self):
         """Process input events for all UI buttons."""
         for button in self.buttons:
             button.check_event()
-        if self.cur_locale != locale.getlocale():
-            self.cur_locale = locale.getlocale()
-            self.texts[0] = Text(
-                self.game,
-                (self.game.window_size[0] // 2, self.game.window_size[1] // 8),
-                Anchor.CENTRE,
-                _("Settings"),
-                150)
+
+    def _rebuild_title(self):
+        """Render the title again in the newly chosen language."""
+        self.texts[0].set_text(_("Settings"))
 
     def update_scene(self):
         """Update the scene state (game logic, animations, etc.)."""
-        for object in self.buttons + self.texts:
-            object.update()
+        for button in self.buttons:
+            button.update()
 
     def draw_scene(self):
         """Render the main menu: background, title, and buttons."""
-        self.game.canvas.fill("white")
-        for objects in self.buttons + self.texts:
-            objects.draw()
-        self.game.blit_screen()
+        self._draw_dirty("white")
+
+
+CARD_BACK_COLORKEY = (255, 0, 255)
 
 
 class GameScene(Scene):
     """Main gameplay scene handling core game rendering and logic."""
 
+    __slots__ = ('game_obj', 'cardtypes_images', 'card_height', 'card_width', 'spacing', 'num_cards', 'card_back',
+                 'hand_cards', 'selected_card_idx', 'hovered_card_idx', 'is_player_turn', 'played_cards',
+                 'opponent_played_cards', 'opponent_hand_rects', '_opponent_hand_size', '_opponent_hand_pairs',
+                 '_opponent_played_pairs', '_played_pairs', '_hand_pairs', '_hand_pairs_hovered_idx',
+                 '_hover_key', '_last_mouse_pressed')
+
     def __init__(self, game, is_first):
         """Initialize the game scene.
 
@@ -480,11 +545,14 @@ class GameScene(Scene):
         super().__init__(game)
         pg.display.set_caption(_('Deadline'))
 
+        # Game logic is only needed once a game starts
+        import Deadline.game_logic as gl
+
         self.game_obj = gl.Game("Player1", "Player2", is_first, self.game.network)
 
         self.cardtypes_images = {
-            "TaskCard": pg.image.load("./textures/card_task.png"),
-            "ActionCard": pg.image.load("./textures/card_action.png")
+            "TaskCard": load_texture("./textures/card_task.png"),
+            "ActionCard": load_texture("./textures/card_action.png")
         }
 
         hand = self.game_obj.get_game_info()['player']['hand']
@@ -499,12 +567,37 @@ class GameScene(Scene):
         self.played_cards = []
         self.is_player_turn = is_first
         self.opponent_played_cards = []
+        self._opponent_played_pairs = []
+        self._played_pairs = []
+        # Blit pairs of the hand, built for the hovered card index they were built with
+        self._hand_pairs = None
+        self._hand_pairs_hovered_idx = None
+
+        # Opponent's cards are face down and look the same, so the card back is rendered once.
+        # Its rounded corners are cut out with a color key, which blits faster than per-pixel alpha.
+        self.card_back = pg.Surface((self.card_width, self.card_height)).convert()
+        self.card_back.fill(CARD_BACK_COLORKEY)
+        self.card_back.set_colorkey(CARD_BACK_COLORKEY, pg.RLEACCEL)
+        card_back_rect = self.card_back.get_rect()
+        pg.draw.rect(self.card_back, (120, 120, 180), card_back_rect, border_radius=16)
+        pg.draw.rect(self.card_back, (60, 60, 100), card_back_rect, width=4, border_radius=16)
+
+        self._opponent_hand_size = -1
+        self.opponent_hand_rects = []
+        self._opponent_hand_pairs = []
+        # Input the hover state was last computed for; it's reset whenever the hand is laid out again
+        self._hover_key = None
+        self._last_mouse_pressed = False
 
         self._layout_hand_cards()
+        self._layout_opponent_hand()
 
     def _layout_hand_cards(self):
         hand = self.game_obj.get_game_info()['player']['hand']
         self.hand_cards = []
+        self._hover_key = None
+        self._hand_pairs = None
+        self.invalidate()
         num_cards = len(hand)
         total_width = num_cards * self.card_width + (num_cards - 1) * self.spacing if num_cards > 0 else 0
         start_x = (self.game.window_size[0] - total_width) // 2 + self.card_width // 2
@@ -527,6 +620,8 @@ class GameScene(Scene):
 
     def _layout_played_cards(self):
         num = len(self.played_cards)
+        self._played_pairs = []
+        self.invalidate()
         if num == 0:
             return
         spacing = 24
@@ -537,10 +632,39 @@ class GameScene(Scene):
         for i, card in enumerate(self.played_cards):
             x = start_x + i * (card_width + spacing)
             card.move_to((x, y))
+            self._played_pairs += card.get_blit_pairs()
+
+    def _build_hand_pairs(self):
+        self._hand_pairs = []
+        self._hand_pairs_hovered_idx = self.hovered_card_idx
+        for idx, card_dict in enumerate(self.hand_cards):
+            if idx == self.hovered_card_idx:
+                x, y = card_dict['pos']
+                self._hand_pairs += card_dict['card'].get_blit_pairs((x, y - 40))
+            else:
+                self._hand_pairs += card_dict['card'].get_blit_pairs()
+
+    def _layout_opponent_played(self):
+        num = len(self.opponent_played_cards)
+        spacing = 24
+        card_width = self.card_width
+        total_width = num * card_width + (num - 1) * spacing
+        start_x = (self.game.window_size[0] - total_width) // 2 + card_width // 2
+        y = self.card_height // 2 + 120
+        self._opponent_played_pairs = []
+        self.invalidate()
+        for i, card in enumerate(self.opponent_played_cards):
+            x = start_x + i * (card_width + spacing)
+            card.move_to((x, y))
+            self._opponent_played_pairs += card.get_blit_pairs()
 
     def _layout_opponent_hand(self):
         hand_size = self.game_obj.get_game_info()['opponent']['hand size']
+        if hand_size == self._opponent_hand_size:
+            return
+        self._opponent_hand_size = hand_size
         self.opponent_hand_rects = []
+        self.invalidate()
         num_cards = hand_size
         total_width = num_cards * self.card_width + (num_cards - 1) * self.spacing if num_cards > 0 else 0
         start_x = (self.game.window_size[0] - total_width) // 2 + self.card_width // 2
@@ -550,26 +674,25 @@ class GameScene(Scene):
             rect = pg.Rect(0, 0, self.card_width, self.card_height)
             rect.center = (x, y)
             self.opponent_hand_rects.append(rect)
-
-    def run(self):
-        """Execute one frame of game loop processing."""
-        self.check_events()
-        self.update_scene()
-        self.draw_scene()
+        self._opponent_hand_pairs = [(self.card_back, rect) for rect in self.opponent_hand_rects]
 
     def check_events(self):
         """Process input events for all UI buttons."""
-        mouse_pos = pg.mouse.get_pos()
-        mouse_pressed = pg.mouse.get_pressed()[0]
+        mouse_pos = self.game.mouse_pos
+        mouse_pressed = self.game.mouse_pressed
+        hover_key = (mouse_pos, self.is_player_turn)
+        if hover_key == self._hover_key and self.selected_card_idx is None and \
+                not mouse_pressed and not self._last_mouse_pressed:
+            return
+        self._hover_key = hover_key
+        self._last_mouse_pressed = mouse_pressed
         self.hovered_card_idx = None
         if not self.is_player_turn:
             return
         for idx, card_dict in enumerate(self.hand_cards):
-            card = card_dict['card']
-            rect = card.rect.copy()
             if self.selected_card_idx == idx:
                 continue
-            if rect.collidepoint(mouse_pos):
+            if card_dict['card'].rect.collidepoint(mouse_pos):
                 self.hovered_card_idx = idx
                 if mouse_pressed:
                     self.selected_card_idx = idx
@@ -590,54 +713,62 @@ class GameScene(Scene):
         """Update the scene state(game logic, animations, etc.)."""
         if not self.is_player_turn:
             event_keys = self.game.network.get_active_events()
+            events_dict = self.game.network.events_dict
             for key in event_keys:
-                event_list = self.game.network.events_dict[key]
-                while event_list:
-                    args = event_list.pop(0)
+                event_list = events_dict[key]
+                for args in event_list:
                     if key == 'use_card':
                         card_idx_in_hand = int(args[3]) if len(args) > 3 else 0
                         self.game_obj.opponent_uses_card(card_idx_in_hand)
                         self._layout_hand_cards()
                         self._layout_played_cards()
+                        self._layout_opponent_played()
                     elif key == 'end_turn':
                         self.is_player_turn = True
+                event_list.clear()
+            if event_keys:
+                self._layout_opponent_hand()
 
     def draw_scene(self):
         """Render the main menu: background, title, and buttons."""
-        self.game.canvas.fill((255, 255, 255))
-        self._layout_opponent_hand()
-        for rect in self.opponent_hand_rects:
-            pg.draw.rect(self.game.canvas, (120, 120, 180), rect, border_radius=16)
-            pg.draw.rect(self.game.canvas, (60, 60, 100), rect, width=4, border_radius=16)
-        num = len(self.opponent_played_cards)
-        if num > 0:
-            spacing = 24
-            card_width = self.card_width
-            total_width = num * card_width + (num - 1) * spacing
-            start_x = (self.game.window_size[0] - total_width) // 2 + card_width // 2
-            y = self.card_height // 2 + 120
-            for i, card in enumerate(self.opponent_played_cards):
-                x = start_x + i * (card_width + spacing)
-                card.move_to((x, y))
-                card.draw()
-        for card in self.played_cards:
-            card.draw()
-        for idx, card_dict in enumerate(self.hand_cards):
-            card = card_dict['card']
-            x, y = card_dict['pos']
-            draw_y = y
-            if idx == self.hovered_card_idx:
-                draw_y = y - 40
-            old_pos = card.pos
-            card.move_to((x, draw_y))
-            card.draw()
-            card.move_to(old_pos)
-        self.game.blit_screen()
+        rects = None
+        if self._hand_pairs is None or self._hand_pairs_hovered_idx != self.hovered_card_idx:
+            # A new hovered card only changes the hand, so only the hand's area is repainted
+            old_area = self._get_hand_area()
+            self._build_hand_pairs()
+            new_area = self._get_hand_area()
+            if old_area is None or new_area is None:
+                self.invalidate()
+            else:
+                rects = [old_area.union(new_area)]
+        # The screen only changes with the layout or the hovered card
+        if self._full_redraw:
+            rects = None
+        elif rects is None:
+            return
+        canvas = self.game.canvas
+        canvas.set_clip(None if rects is None else rects[0])
+        canvas.fill((255, 255, 255))
+        canvas.fblits(self._opponent_hand_pairs)
+        canvas.fblits(self._opponent_played_pairs)
+        canvas.fblits(self._played_pairs)
+        canvas.fblits(self._hand_pairs)
+        canvas.set_clip(None)
+        self._full_redraw = False
+        self.game.blit_screen(rects)
+
+    def _get_hand_area(self):
+        """Get the area covered by the hand as last built by `_build_hand_pairs()`, or None if there's none."""
+        if not self._hand_pairs:
+            return None
+        return self._hand_pairs[0][1].unionall([rect for _surface, rect in self._hand_pairs[1:]])
 
 
 class EmptyScene(Scene):
     """Placeholder scene used for testing and transitions."""
 
+    __slots__ = ()
+
     def __init__(self, game):
         """Initialize an empty placeholder scene.
 
@@ -647,12 +778,7 @@ class EmptyScene(Scene):
         """
         pg.display.set_caption('Empty')
         super().__init__(game)
-
-    def run(self):
-        """Execute one frame of scene processing."""
-        self.check_events()
-        self.update_scene()
-        self.draw_scene()
+        self._run_steps = (self.draw_scene,)  # The other phases have no work
 
     def check_events(self):
         """Process input events for all UI buttons."""
@@ -1,7 +1,7 @@
 import unittest
 import sys
 
-from Deadline.game_logic import CardTarget, Deadline as Dl, Game
+from Deadline.game_logic import CardTarget, Deadline as Dl, Game, Task
 
 sys.path.insert(0, '..')
 
@@ -114,3 +114,48 @@ class TestGame(unittest.TestCase):
         for _ in range(player.hours_today + 2):
             game1.player_uses_card(0, game1._player_pid)
         self.assertEqual(player.hours_today, game1._HOURS_IN_DAY_MAX)
+
+    def test_09_events(self):
+        network = MockNetwork()
+        game1 = Game('player1', 'player2', True, network)
+        player = game1._player
+
+        game1._events([('special task', ['t0']), ('ocean of deadlines', [])], game1._player_pid)
+        self.assertEqual([deadline.task.tid for deadline in player.deadlines], ['t0'])
+
+    def test_10_settle_all_completed_deadlines(self):
+        network = MockNetwork()
+        game1 = Game('player1', 'player2', True, network)
+        player = game1._player
+
+        for _ in range(2):
+            deadline = Dl(game1._ALL_TASKS['t0'], game1._day)
+            deadline.work(deadline.get_rem_hours())
+            player.deadlines.append(deadline)
+        game1.turn_end()
+        self.assertEqual(player.deadlines, [])
+        self.assertEqual(player.score, 2 * game1._ALL_TASKS['t0'].award)
+
+    def test_11_random_events_in_sync(self):
+        network = MockNetwork()
+        game1 = Game('player1', 'player2', True, network)
+        game2 = Game('player2', 'player1', False, network)
+
+        for _ in range(10):
+            game1._events([('met opt', ['t0'])], game1._player_pid)
+            game2._events([('met opt', ['t0'])], game2._opponent_pid)
+        self.assertEqual(game1._player.score, game2._opponent.score)
+        self.assertEqual(len(game1._player.deadlines), len(game2._opponent.deadlines))
+
+    def test_12_fail_deadline_with_kurs_failed_event(self):
+        network = MockNetwork()
+        game1 = Game('player1', 'player2', True, network)
+        player = game1._player
+        task = Task('t6', 'Kurs', '', '', 60, 0, 80, -10, [], [('kurs failed', ['t6'])])
+
+        deadline = Dl(task, game1._day)
+        deadline.work(10)
+        player.deadlines.append(deadline)
+        game1._settle_deadlines(game1._player_pid, completed=False)
+        self.assertEqual(player.deadlines, [])
+        self.assertEqual(player.score, task.penalty - deadline.get_rem_hours() * 2)
@@ -0,0 +1,61 @@
+import os
+import unittest
+import sys
+from unittest import mock
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame as pg  # noqa: E402
+
+from Deadline import scene  # noqa: E402
+from Deadline.game import Game, NET_CONNECTED  # noqa: E402
+
+sys.path.insert(0, '..')
+
+
+class TestScene(unittest.TestCase):
+    def setUp(self):
+        self.game = Game(scene.MainMenu)
+        # GameScene would start a real game over the network
+        patcher = mock.patch.object(scene, 'GameScene')
+        self.game_scene = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_01_connected_in_other_scene(self):
+        # The main menu drops the event
+        self.game.network.connection = True
+        pg.event.post(pg.event.Event(NET_CONNECTED))
+        self.game.poll_input()
+        self.game.current_scene.run()
+        self.assertIsInstance(self.game.current_scene, scene.MainMenu)
+        self.game.current_scene = scene.HostScene(self.game)
+        self.game.poll_input()
+        self.game.current_scene.run()
+        self.game_scene.assert_called_once_with(self.game, is_first=True)
+
+    def test_02_connected_during_error_popup(self):
+        self.game.current_scene = scene.ConnectScene(self.game)
+        self.game.poll_input()
+        self.game.current_scene.run()
+        # Game.run() polls the input, but runs the error popup instead of the scene
+        self.game.network.connection = True
+        pg.event.post(pg.event.Event(NET_CONNECTED))
+        self.game.poll_input()
+        self.game_scene.assert_not_called()
+        # The popup is dismissed
+        self.game.current_scene.invalidate()
+        self.game.poll_input()
+        self.game.current_scene.run()
+        self.game_scene.assert_called_once_with(self.game, is_first=False)
+
+    def test_03_render_background_with_text_fields(self):
+        connect_scene = scene.ConnectScene(self.game)
+        background = connect_scene._render_background("white")
+        self.assertEqual(background.get_size(), self.game.canvas.get_size())
+        self.assertTrue(all(field.is_idle() for field in (connect_scene.ip_field, connect_scene.port_field)))
+        connect_scene.ip_field.active = True
+        self.assertFalse(connect_scene.ip_field.is_idle())
+
+
+if __name__ == '__main__':
+    unittest.main()